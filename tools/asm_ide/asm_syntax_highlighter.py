@@ -48,7 +48,7 @@ _CLICKABLE_RAM_VAR_COLOR = QTextCharFormat()
 _CLICKABLE_RAM_VAR_COLOR.setForeground(_RAM_VARIABLE_COLOR)
 _CLICKABLE_RAM_VAR_COLOR.setUnderlineStyle(QTextCharFormat.UnderlineStyle.SingleUnderline)
 
-_REGEXPS = [
+_REGEXPS = (
     _DEC_NUMBER_REGEX,
     _HEX_NUMBER_REGEX,
     _BIN_NUMBER_REGEX,
@@ -58,9 +58,9 @@ _REGEXPS = [
     _CONST_LABEL_CALL_RAM_VAR_REGEX,
     _STRING_REGEX,
     _COMMENT_REGEX,
-]
+)
 
-_COLORS = [
+_COLORS = (
     _DEC_NUMBER_COLOR,
     _HEX_NUMBER_COLOR,
     _BIN_NUMBER_COLOR,
@@ -70,7 +70,10 @@ _COLORS = [
     _CONST_COLOR,  # Not actually used, this will be coloured, depending on what is found
     _STRING_COLOR,
     _COMMENT_COLOR,
-]
+)
+
+# highlightBlock runs for every line of the document, so only pair these up once
+_REGEXPS_AND_COLORS = tuple(zip(_REGEXPS, _COLORS, strict=True))
 
 _REF_TYPE_TO_COLOR = {
     ReferenceType.CONSTANT: _CONST_COLOR,
@@ -78,6 +81,12 @@ _REF_TYPE_TO_COLOR = {
     ReferenceType.LABEL: _LABEL_COLOR,
 }
 
+_REF_TYPE_TO_CLICKABLE_FORMAT = {
+    ReferenceType.CONSTANT: _CLICKABLE_CONST_COLOR,
+    ReferenceType.RAM_VAR: _CLICKABLE_RAM_VAR_COLOR,
+    ReferenceType.LABEL: _CLICKABLE_LABEL_COLOR,
+}
+
 
 class AsmSyntaxHighlighter(QSyntaxHighlighter):
     def __init__(self, parent, reference_finder: ReferenceFinder):
@@ -93,7 +102,7 @@ class AsmSyntaxHighlighter(QSyntaxHighlighter):
         self._format_instructions_in_line(line)
         self._format_directives_in_line(line)
 
-        for expression, color in zip(_REGEXPS, _COLORS, strict=True):
+        for expression, color in _REGEXPS_AND_COLORS:
             match_iterator = expression.globalMatch(line)
 
             for capture_start, capture_length, capture_text in self._iter_matches(match_iterator):
@@ -140,12 +149,7 @@ class AsmSyntaxHighlighter(QSyntaxHighlighter):
         if self.reference_under_cursor is None:
             return
 
-        if self.reference_under_cursor.type == ReferenceType.CONSTANT:
-            text_format = _CLICKABLE_CONST_COLOR
-        elif self.reference_under_cursor.type == ReferenceType.RAM_VAR:
-            text_format = _CLICKABLE_RAM_VAR_COLOR
-        else:
-            text_format = _CLICKABLE_LABEL_COLOR
+        text_format = _REF_TYPE_TO_CLICKABLE_FORMAT.get(self.reference_under_cursor.type, _CLICKABLE_LABEL_COLOR)
 
         self.setFormat(capture_start, capture_length, text_format.toCharFormat())
 
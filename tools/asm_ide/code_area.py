@@ -1,3 +1,4 @@
+from heapq import nsmallest
 from pathlib import Path
 
 from PySide6.QtCore import QPoint, Qt, QTimer, Signal, SignalInstance
@@ -31,6 +32,13 @@ from tools.asm_ide.reference_finder import (
 from tools.asm_ide.search_bar import SearchBar, SearchDirection
 from tools.asm_ide.util import ctrl_is_pressed
 
+_SEARCH_TERM_FORMAT = QTextCharFormat()
+_SEARCH_TERM_FORMAT.setBackground(QBrush(QColor.fromRgb(255, 204, 255)))
+
+_LINE_HIGHLIGHT_FORMAT = QTextCharFormat()
+_LINE_HIGHLIGHT_FORMAT.setProperty(QTextFormat.Property.FullWidthSelection, True)
+_LINE_HIGHLIGHT_FORMAT.setBackground(QBrush(QColor(255, 255, 153)))
+
 
 class CodeArea(QPlainTextEdit):
     text_position_clicked = Signal(int)
@@ -70,12 +78,24 @@ class CodeArea(QPlainTextEdit):
         # line number area
         self.line_number_area = LineNumberArea(self)
         self.updateRequest.connect(self.line_number_area.react_to_editor)
-        self.blockCountChanged.connect(self.line_number_area.update_text_measurements)
+        self.blockCountChanged.connect(self.line_number_area.react_to_block_count_change)
 
         # word under cursor
         self.last_block: QTextBlock | None = None
         self.last_word = ""
 
+        self._last_hover_position: tuple[int, int, int] | None = None
+        """
+        The text position under the mouse, the revision of the document and the generation of the parsed definitions,
+        at the last mouse move.
+        """
+
+        self._tooltip_shown = False
+
+        self._tooltip_font = QFont("Monospace")
+        self._tooltip_max_results = 0
+        """Read from the settings in update_from_settings, instead of on every hover over a reference."""
+
         # extra current line and search highlighting
         self.cursorPositionChanged.connect(self._update_extra_selections)
 
@@ -88,6 +108,13 @@ class CodeArea(QPlainTextEdit):
 
         self._current_search_cursor: QTextCursor = QTextCursor()
 
+        self._search_highlights: list[QTextEdit.ExtraSelection] = []
+        self._search_highlights_term: str | None = None
+        """
+        The search term the cached search highlights were found for. Set to None, when the text of the document
+        changes, so the highlights are searched for again.
+        """
+
         self._text_change_delay_timer = QTimer(self)
         """
         A QTimer, that is connected to the different CodeArea objects. Whenever their text changes, this timer will be
@@ -99,6 +126,7 @@ class CodeArea(QPlainTextEdit):
         self._text_change_delay_timer.timeout.connect(self.contents_changed.emit)
 
         self.document().contentsChange.connect(self._maybe_trigger_timer)
+        self.document().contentsChange.connect(self._maybe_invalidate_search_highlights)
 
         self._redirect_pop_up: RedirectPopup | None = None
 
@@ -107,16 +135,23 @@ class CodeArea(QPlainTextEdit):
     def update_from_settings(self):
         settings = AppSettings()
 
-        self._font = QFont(
+        font = QFont(
             settings.value(AppSettingKeys.EDITOR_CODE_FONT_NAME),
             settings.value(AppSettingKeys.EDITOR_CODE_FONT_SIZE),
         )
 
-        self._font.setBold(settings.value(AppSettingKeys.EDITOR_CODE_FONT_BOLD))
-        self.text_document.setDefaultFont(self._font)
+        font.setBold(settings.value(AppSettingKeys.EDITOR_CODE_FONT_BOLD))
+
+        # setting the default font lays out the whole document again, so only do it, when the font actually changed
+        if font != self._font:
+            self._font = font
+            self.text_document.setDefaultFont(self._font)
 
         self.line_number_area.update_text_measurements()
 
+        self._tooltip_font = QFont("Monospace", settings.value(AppSettingKeys.EDITOR_CODE_FONT_SIZE))
+        self._tooltip_max_results = settings.value(AppSettingKeys.EDITOR_TOOLTIP_MAX_RESULTS)
+
         self._text_change_delay_timer.setInterval(settings.value(AppSettingKeys.APP_REPARSE_DELAY_MS))
 
     def _maybe_trigger_timer(self, _: int, chars_added: int, chars_removed: int) -> None:
@@ -131,6 +166,13 @@ class CodeArea(QPlainTextEdit):
 
         self._text_change_delay_timer.start()
 
+    def _maybe_invalidate_search_highlights(self, _: int, chars_added: int, chars_removed: int) -> None:
+        """Only throw away the cached search highlights, if the text actually changed. See _maybe_trigger_timer."""
+        if chars_added == chars_removed == 0:
+            return
+
+        self._search_highlights_term = None
+
     def focus_search_bar(self):
         self._search_bar.setFocus()
 
@@ -190,10 +232,11 @@ class CodeArea(QPlainTextEdit):
         if not search_term or not self._search_bar.should_highlight_all_matches:
             return [QTextEdit.ExtraSelection()]
 
-        search_term_selections: list[QTextEdit.ExtraSelection] = []
+        # this is called on every cursor movement, so only search the whole document again, if something changed
+        if search_term == self._search_highlights_term:
+            return self._search_highlights
 
-        search_term_format = QTextCharFormat()
-        search_term_format.setBackground(QBrush(QColor.fromRgb(255, 204, 255)))
+        search_term_selections: list[QTextEdit.ExtraSelection] = []
 
         current_text_cursor = self.textCursor()
         current_text_cursor.movePosition(QTextCursor.MoveOperation.Start, QTextCursor.MoveMode.MoveAnchor)
@@ -204,28 +247,40 @@ class CodeArea(QPlainTextEdit):
             search_term_selection = QTextEdit.ExtraSelection()
 
             search_term_selection.cursor = next_match_cursor
-            search_term_selection.format = search_term_format
+            search_term_selection.format = _SEARCH_TERM_FORMAT
 
             search_term_selections.append(search_term_selection)
 
+        self._search_highlights = search_term_selections
+        self._search_highlights_term = search_term
+
         return search_term_selections
 
     def _get_current_line_highlight(self):
         current_line_selection = QTextEdit.ExtraSelection()
 
-        line_highlight_format = QTextCharFormat()
-        line_highlight_format.setProperty(QTextFormat.Property.FullWidthSelection, True)
-        line_highlight_format.setBackground(QBrush(QColor(255, 255, 153)))
-
         current_line_selection.cursor = self.textCursor()
         current_line_selection.cursor.clearSelection()
-        current_line_selection.format = line_highlight_format
+        current_line_selection.format = _LINE_HIGHLIGHT_FORMAT
 
         return current_line_selection
 
     def mouseMoveEvent(self, e):
         text_cursor = self.cursorForPosition(e.pos())
 
+        # most mouse moves stay on the same character, or past the end of the same line, so the word can't have changed.
+        # a finished reparse changes the definitions, which could give the same word a tooltip now, so check for that
+        hover_position = (
+            text_cursor.position(),
+            self.text_document.revision(),
+            self._reference_finder.generation,
+        )
+
+        if hover_position == self._last_hover_position:
+            return super().mouseMoveEvent(e)
+
+        self._last_hover_position = hover_position
+
         text_cursor.select(QTextCursor.SelectionType.WordUnderCursor)
         word = text_cursor.selectedText().strip()
 
@@ -249,35 +304,46 @@ class CodeArea(QPlainTextEdit):
         return super().mouseMoveEvent(e)
 
     def _update_tooltip(self, e, text_cursor, word):
-        settings = AppSettings()
-
         if word not in self._reference_finder.definitions:
-            self.setToolTip(None)
+            # only reset the tooltip once, when moving off of a reference, not for every word without a definition
+            if self._tooltip_shown:
+                self.setToolTip(None)
+                self._tooltip_shown = False
+
             return
 
         self.last_word = word
         tooltip = QToolTip()
-        tooltip.setFont(QFont("Monospace", settings.value(AppSettingKeys.EDITOR_CODE_FONT_SIZE)))
+        tooltip.setFont(self._tooltip_font)
 
         definition = self._reference_finder.definitions[word]
         self.syntax_highlighter.reference_under_cursor = definition
 
         name, value, file, line_no, ref_type, line = definition
 
-        tooltip_text = f"{file}+{line_no}: {name} = {value}"
-        tooltip_max_results = settings.value(AppSettingKeys.EDITOR_TOOLTIP_MAX_RESULTS)
+        tooltip_lines = [f"{file}+{line_no}: {name} = {value}"]
+        tooltip_max_results = self._tooltip_max_results
 
         if self._reference_finder.name_to_references.get(name, False) and tooltip_max_results != 0:
-            tooltip_text += "\n\nReferenced at:"
+            tooltip_lines.append("\nReferenced at:")
+
+            references = self._reference_finder.name_to_references[name]
+
+            # only the first few references are shown, so don't sort all of them, if there is a limit
+            if tooltip_max_results > 0:
+                shown_references = nsmallest(tooltip_max_results, references)
+            else:
+                shown_references = sorted(references)
 
-            for index, reference in enumerate(sorted(self._reference_finder.name_to_references[name]), 1):
-                tooltip_text += f"\n{reference.origin_file}+{reference.origin_line_no}: {reference.line}"
+            for index, reference in enumerate(shown_references, 1):
+                tooltip_lines.append(f"{reference.origin_file}+{reference.origin_line_no}: {reference.line}")
 
                 if index == tooltip_max_results:
-                    tooltip_text += "\n  ..."
+                    tooltip_lines.append("  ...")
                     break
 
-        tooltip.showText(e.globalPos(), tooltip_text, self)
+        tooltip.showText(e.globalPos(), "\n".join(tooltip_lines), self)
+        self._tooltip_shown = True
 
         self.last_block = text_cursor.block()
         self.syntax_highlighter.rehighlightBlock(self.last_block)
@@ -338,7 +404,9 @@ class CodeArea(QPlainTextEdit):
 
     def _create_redirect_popup(self, definition, references) -> RedirectPopup:
         if self._redirect_pop_up is not None:
+            # closing alone would keep the old popup, its table and connections around for the lifetime of the editor
             self._redirect_pop_up.close()
+            self._redirect_pop_up.deleteLater()
 
         redirect_pop_up = RedirectPopup(definition, references, self)
         redirect_pop_up.table_widget.row_clicked.connect(self.redirect_clicked.emit)
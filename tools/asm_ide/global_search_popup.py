@@ -62,6 +62,9 @@ class GlobalSearchPopup(QWidget):
         super(GlobalSearchPopup, self).__init__(parent)
         self.setAutoFillBackground(True)
 
+        # a new popup is created for every search and holds the text of all files, so don't keep closed ones around
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+
         self._layout = QVBoxLayout()
         self.setLayout(self._layout)
 
@@ -93,6 +96,11 @@ class GlobalSearchPopup(QWidget):
         self._search_input.setFocus()
 
         self._search_text_by_file = search_text_by_file
+        self._search_lines: list[tuple[SearchResult, str]] = []
+        """
+        Every line of every searchable file, paired with its lower case version.
+        Built on the first full search, so repeated searches don't have to split and lower the whole text again.
+        """
         self._last_search_term = ""
 
         self._results_cache: dict[str, list[SearchResult]] = {"": []}
@@ -125,12 +133,12 @@ class GlobalSearchPopup(QWidget):
 
         # case 4, search term was changed in a way, that requires searching everything again
         elif len(new_search_term) >= self.MINIMUM_CHAR_COUNT_FOR_SEARCH:
-            for file_path, search_text in self._search_text_by_file.items():
-                lines = search_text.splitlines()
+            if not self._search_lines:
+                self._index_search_lines()
 
-                for line_no, line in enumerate(lines, 1):
-                    if new_search_term in line.lower():
-                        search_results.append(SearchResult(file_path, line_no, line))
+            for result, lower_line in self._search_lines:
+                if new_search_term in lower_line:
+                    search_results.append(result)
 
         self._last_search_term = new_search_term
         self._results_cache[new_search_term] = search_results
@@ -146,6 +154,11 @@ class GlobalSearchPopup(QWidget):
 
         self.resize(QSize(width, height))
 
+    def _index_search_lines(self):
+        for file_path, search_text in self._search_text_by_file.items():
+            for line_no, line in enumerate(search_text.splitlines(), 1):
+                self._search_lines.append((SearchResult(file_path, line_no, line), line.lower()))
+
     def resize_for_height(self, height: int):
         if height > self.table_widget.sizeHint().height():
             return
@@ -178,6 +191,9 @@ class SearchResultsTable(TableWidget):
         self._bold_font.setBold(True)
 
     def set_search_results(self, search_results: list[SearchResult]):
+        # don't repaint for every added cell, only once all results are in
+        self.setUpdatesEnabled(False)
+
         self.clear()
 
         self.setRowCount(len(search_results))
@@ -199,3 +215,5 @@ class SearchResultsTable(TableWidget):
 
         self.resizeColumnsToContents()
         self.resizeRowsToContents()
+
+        self.setUpdatesEnabled(True)
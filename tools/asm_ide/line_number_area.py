@@ -27,11 +27,16 @@ class LineNumberArea(QWidget):
 
         self._line_no_width = self._line_no_height = 1
 
+        self._measured_no_of_digits = 0
+        """The number of digits the current line number width was measured for."""
+
         self.lines_to_highlight: list[int] = []
 
     def update_text_measurements(self):
+        self._measured_no_of_digits = self.no_of_digits
+
         font_metrics = QFontMetrics(self.editor.document().defaultFont())
-        self._line_no_width = font_metrics.horizontalAdvance(self.no_of_digits * "9")
+        self._line_no_width = font_metrics.horizontalAdvance(self._measured_no_of_digits * "9")
         self._line_no_height = font_metrics.lineSpacing()
 
         viewport_margins = self.editor.viewportMargins()
@@ -41,6 +46,13 @@ class LineNumberArea(QWidget):
         # weird bug, when there are no tabs, you open one, the QPaintEvent rects don't grow with the widget. so force it
         self.resize(self.sizeHint())
 
+    def react_to_block_count_change(self, _):
+        # the width only depends on the number of digits, so don't change the viewport margins on every new line
+        if self.no_of_digits == self._measured_no_of_digits:
+            return
+
+        self.update_text_measurements()
+
     @property
     def no_of_digits(self):
         line_count = self.editor.document().lineCount()
@@ -54,7 +66,7 @@ class LineNumberArea(QWidget):
 
     def react_to_editor(self, _, scrolled_by: int):
         if scrolled_by != 0:
-            self.repaint()
+            self.update()
 
     def paintEvent(self, event: QPaintEvent):
         self.paint_area()
@@ -70,25 +82,33 @@ class LineNumberArea(QWidget):
 
         rect = QRect(self.MARGIN_LEFT, top, self._line_no_width, bottom)
 
-        while block.isValid() and block.isVisible():
+        # look these up once, instead of for every painted line
+        lines_to_highlight = set(self.lines_to_highlight)
+        alignment = Qt.AlignmentFlag.AlignBaseline | Qt.AlignmentFlag.AlignRight
+        line_offset = self._line_no_height + 1
+        # the widget itself is as high as the maximum size of the editor, so use the height of the visible text instead
+        area_bottom = self.editor.viewport().height()
+
+        # only paint the line numbers, that are actually on screen, not every line until the end of the document
+        while block.isValid() and block.isVisible() and rect.top() <= area_bottom:
             line_number = block.blockNumber() + 1
             line_no_str = str(line_number)
 
-            if line_number in self.lines_to_highlight:
+            if line_number in lines_to_highlight:
                 painter.save()
 
                 painter.setPen(QColor(255, 255, 255))
                 painter.setBrush(_LINE_NO_COLOR)
 
                 painter.fillRect(rect, painter.brush())
-                painter.drawText(rect, Qt.AlignmentFlag.AlignBaseline | Qt.AlignmentFlag.AlignRight, line_no_str)
+                painter.drawText(rect, alignment, line_no_str)
 
                 painter.restore()
 
             else:
-                painter.drawText(rect, Qt.AlignmentFlag.AlignBaseline | Qt.AlignmentFlag.AlignRight, line_no_str)
+                painter.drawText(rect, alignment, line_no_str)
 
-            rect.adjust(0, self._line_no_height + 1, 0, self._line_no_height + 1)
+            rect.adjust(0, line_offset, 0, line_offset)
 
             block = block.next()
 
@@ -110,7 +130,7 @@ class LineNumberArea(QWidget):
 
         self.line_number_highlighted.emit(self.lines_to_highlight)
 
-        self.repaint()
+        self.update()
 
         return super().mousePressEvent(event)
 
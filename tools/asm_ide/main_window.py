@@ -61,6 +61,9 @@ class MainWindow(QMainWindow):
 
         self._global_search_widget: GlobalSearchPopup | None = None
 
+        self._file_contents_cache: dict[Path, tuple[int, int, str]] = {}
+        """Contents of the asm files on disk, together with the modification time and size they were read at."""
+
         self._reference_finder = ReferenceFinder()
 
         self._tab_widget = TabWidget(self, self._reference_finder)
@@ -273,11 +276,11 @@ class MainWindow(QMainWindow):
         # todo only parse the PRG files mentioned in smb3.asm?
         asm: dict[Path, str] = dict()
 
-        for asm_path in [self._root_path / "smb3.asm"] + self.prg_files:
-            if asm_path in self._tab_widget.tab_index_to_path:
-                tab_index = self._tab_widget.tab_index_to_path.index(asm_path)
+        tab_index_by_path = {abs_path: index for index, abs_path in enumerate(self._tab_widget.tab_index_to_path)}
 
-                code_area = self._tab_widget.widget(tab_index)
+        for asm_path in [self._root_path / "smb3.asm"] + self.prg_files:
+            if asm_path in tab_index_by_path:
+                code_area = self._tab_widget.widget(tab_index_by_path[asm_path])
 
                 if code_area is None:
                     continue
@@ -285,10 +288,26 @@ class MainWindow(QMainWindow):
                 asm[asm_path.relative_to(self._root_path)] = code_area.text_document.toPlainText()
 
             else:
-                asm[asm_path.relative_to(self._root_path)] = asm_path.read_text()
+                asm[asm_path.relative_to(self._root_path)] = self._read_asm_file(asm_path)
 
         return asm
 
+    def _read_asm_file(self, asm_path: Path) -> str:
+        # this is done for every file on every reparse, so only read the files again, that changed on disk
+        stat = asm_path.stat()
+
+        if (cached_file := self._file_contents_cache.get(asm_path)) is not None:
+            mtime_ns, size, text = cached_file
+
+            if mtime_ns == stat.st_mtime_ns and size == stat.st_size:
+                return text
+
+        text = asm_path.read_text()
+
+        self._file_contents_cache[asm_path] = stat.st_mtime_ns, stat.st_size, text
+
+        return text
+
     def _on_open(self, *, path: Path | None = None):
         if self._tab_widget and not self._tab_widget.ask_to_quit_all_tabs_without_saving():
             return False
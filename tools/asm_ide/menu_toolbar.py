@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, Slot
 from PySide6.QtWidgets import QToolBar, QToolButton
 
 from tools.asm_ide.text_position_stack import TextPositionStack
@@ -71,21 +71,25 @@ class MenuToolbar(QToolBar):
         self.assemble_rom_action = self.addAction("Assemble ROM")
         self.assemble_rom_action.setIcon(icon("terminal.svg"))
 
+    @Slot(bool, bool)
     def update_save_status(self, current_document_is_modified: bool, any_document_is_modified: bool):
         self.save_current_file_action.setEnabled(current_document_is_modified)
         self.save_all_files_action.setEnabled(any_document_is_modified)
 
         self._save_button.setEnabled(any_document_is_modified)
 
+    @Slot(bool, bool)
     def update_undo_redo_buttons(self, undo_available: bool, redo_available: bool):
         self.undo_action.setEnabled(undo_available)
         self.redo_action.setEnabled(redo_available)
 
+    @Slot(Path, int)
     def push_position(self, abs_path: Path, block_index: int):
         self._position_stack.push(abs_path, block_index)
 
         self._update_navigation_buttons()
 
+    @Slot()
     def _go_back(self):
         if self._position_stack.is_at_the_beginning():
             return
@@ -96,6 +100,7 @@ class MenuToolbar(QToolBar):
 
         self._update_navigation_buttons()
 
+    @Slot()
     def _go_forward(self):
         if self._position_stack.is_at_the_end():
             return
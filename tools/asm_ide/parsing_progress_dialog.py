@@ -27,6 +27,3 @@ class ParsingProgressDialog(QProgressDialog):
         self.setLabelText(text)
 
         QApplication.processEvents()
-
-    def close(self):
-        return super().close()
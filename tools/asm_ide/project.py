@@ -66,18 +66,20 @@ class Project:
             return
 
         project_settings = ProjectSettings(self._root_path)
-        project_settings.clear_open_files()
 
-        for index, code_area in enumerate(self._tab_widget.widgets()):
-            abs_path = self._tab_widget.tab_index_to_path[index]
+        with project_settings.batch_update():
+            project_settings.clear_open_files()
 
-            text_position = code_area.textCursor().position()
-            scroll_position = code_area.verticalScrollBar().value()
+            for index, code_area in enumerate(self._tab_widget.widgets()):
+                abs_path = self._tab_widget.tab_index_to_path[index]
 
-            project_settings.add_open_file(abs_path)
-            project_settings.save_position_in_file(abs_path, text_position, scroll_position)
+                text_position = code_area.textCursor().position()
+                scroll_position = code_area.verticalScrollBar().value()
 
-        open_tab_index = self._tab_widget.currentIndex()
-        project_settings.set_value(ProjectSettingKeys.OPEN_TAB_INDEX, open_tab_index)
+                project_settings.add_open_file(abs_path)
+                project_settings.save_position_in_file(abs_path, text_position, scroll_position)
+
+            open_tab_index = self._tab_widget.currentIndex()
+            project_settings.set_value(ProjectSettingKeys.OPEN_TAB_INDEX, open_tab_index)
 
         self.is_open = False
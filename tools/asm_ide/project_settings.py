@@ -1,4 +1,5 @@
 import json
+from contextlib import contextmanager
 from enum import StrEnum
 from pathlib import Path
 from typing import Any
@@ -26,6 +27,9 @@ class ProjectSettings:
 
         self._settings: dict[ProjectSettingKeys, Any] = {}
 
+        self._in_batch_update = False
+        """When set, changed values are only written to disk once the batch update is done."""
+
         self._init_settings()
 
     def _init_settings(self):
@@ -37,7 +41,22 @@ class ProjectSettings:
     def set_value(self, key: ProjectSettingKeys, value):
         self._settings[key] = value
 
-        self.sync()
+        if not self._in_batch_update:
+            self.sync()
+
+    @contextmanager
+    def batch_update(self):
+        """
+        Defers writing the settings to disk until the end of the with block, so that a lot of changes in a row only
+        result in one write.
+        """
+        self._in_batch_update = True
+
+        try:
+            yield self
+        finally:
+            self._in_batch_update = False
+            self.sync()
 
     def value(self, key: ProjectSettingKeys):
         return self._settings[key]
@@ -63,6 +63,9 @@ class ReferenceTableWidget(TableWidget):
         self._bold_font.setBold(True)
 
     def set_references(self, definition: ReferenceDefinition, references: list[ReferenceDefinition]):
+        # don't repaint for every added cell, only once all references are in
+        self.setUpdatesEnabled(False)
+
         # set row count
         row_count = 1 + 1  # "Definitions" label row and the actual definition
 
@@ -78,6 +81,8 @@ class ReferenceTableWidget(TableWidget):
         self.resizeColumnsToContents()
         self.resizeRowsToContents()
 
+        self.setUpdatesEnabled(True)
+
     def _add_label_row(self, label_text: str):
         label_item = QTableWidgetItem(label_text)
         label_item.setForeground(QColor.fromRgb(0xA0A1A7))
@@ -34,6 +34,13 @@ _RAM_REGEX = QRegularExpression(r"([A-Za-z_][A-Za-z0-9_]*)\:\s*(\.ds.*)")
 
 _CONST_LABEL_CALL_RAM_VAR_REGEX = QRegularExpression(r"([A-Za-z_][A-Za-z0-9_]*)")
 
+# the order matters, since RAM variables would otherwise also match as labels
+_DEFINITION_REGEX_TO_TYPE = (
+    (_CONST_REGEX, ReferenceType.CONSTANT),
+    (_RAM_REGEX, ReferenceType.RAM_VAR),
+    (_LABEL_REGEX, ReferenceType.LABEL),
+)
+
 
 class ParserSignals(QObject):
     finished = Signal()
@@ -64,6 +71,9 @@ class ReferenceFinder(QRunnable):
         self.name_to_references: dict[str, set[ReferenceDefinition]] = defaultdict(set)
         self._name_to_references: dict[str, set[ReferenceDefinition]] = defaultdict(set)
 
+        self.generation = 0
+        """Incremented every time the published definitions and references change, so users can tell they are stale."""
+
         self.signals = ParserSignals()
 
         self.setAutoDelete(False)
@@ -71,6 +81,7 @@ class ReferenceFinder(QRunnable):
     def clear(self):
         self.definitions.clear()
         self.name_to_references.clear()
+        self.generation += 1
 
         self._path_to_data.clear()
         self._currently_open_file = None
@@ -104,9 +115,10 @@ class ReferenceFinder(QRunnable):
         self.signals.progress_made.emit(progress, "Cleaning up References")
         self._cleanup_references()
 
-        # Copy over new state
-        self.definitions = self._definitions.copy()
-        self.name_to_references = self._name_to_references.copy()
+        # Hand over the new state. No need to copy it, since the next run starts from a copy of it, or from scratch
+        self.definitions, self._definitions = self._definitions, {}
+        self.name_to_references, self._name_to_references = self._name_to_references, defaultdict(set)
+        self.generation += 1
 
         self._path_to_data.clear()
 
@@ -158,10 +170,7 @@ class ReferenceFinder(QRunnable):
     def _find_definitions_in_line(self, line, line_no, rel_path):
         clean_line = strip_comment(line)
 
-        for regex, ref_type in zip(
-            (_CONST_REGEX, _RAM_REGEX, _LABEL_REGEX),
-            (ReferenceType.CONSTANT, ReferenceType.RAM_VAR, ReferenceType.LABEL),
-        ):
+        for regex, ref_type in _DEFINITION_REGEX_TO_TYPE:
             match_iterator = regex.globalMatch(clean_line)
 
             we_matched = match_iterator.hasNext()
@@ -207,14 +216,15 @@ class ReferenceFinder(QRunnable):
         clean_line = strip_comment(line)
         match_iterator = _CONST_LABEL_CALL_RAM_VAR_REGEX.globalMatch(clean_line)
 
+        # a line usually references multiple names, so only normalize its whitespace once
+        normalized_line = " ".join(line.split())
+
         while match_iterator.hasNext():
             match = match_iterator.next()
 
             matched_name = match.capturedView(1)
 
-            reference = ReferenceDefinition(
-                matched_name, "", rel_path, line_no, ReferenceType.UNSET, " ".join(line.split())
-            )
+            reference = ReferenceDefinition(matched_name, "", rel_path, line_no, ReferenceType.UNSET, normalized_line)
 
             self._name_to_references[matched_name].add(reference)
 
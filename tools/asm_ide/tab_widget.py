@@ -247,7 +247,7 @@ class TabWidget(QTabWidget):
             if widget is not None:
                 yield widget
 
-    def _close_tab(self, index: int, ask_before_close=True):
+    def _close_tab(self, index: int, ask_before_close=True, project_settings: ProjectSettings | None = None):
         path_of_tab = self.tab_index_to_path[index]
 
         code_area = self.widget(index)
@@ -263,7 +263,10 @@ class TabWidget(QTabWidget):
         text_position = code_area.textCursor().position()
         scroll_position = code_area.verticalScrollBar().value()
 
-        ProjectSettings(self.root_path).save_position_in_file(path_of_tab, text_position, scroll_position)
+        if project_settings is None:
+            project_settings = ProjectSettings(self.root_path)
+
+        project_settings.save_position_in_file(path_of_tab, text_position, scroll_position)
 
         self.tab_index_to_path.pop(index)
         self.removeTab(index)
@@ -328,8 +331,13 @@ class TabWidget(QTabWidget):
         return self._ask_for_close_without_saving(modified_file_names)
 
     def clear(self):
-        for index in reversed(range(self.count())):
-            self._close_tab(index, ask_before_close=False)
+        if self.count():
+            # load and save the project settings once for all tabs, instead of once per tab
+            project_settings = ProjectSettings(self.root_path)
+
+            with project_settings.batch_update():
+                for index in reversed(range(self.count())):
+                    self._close_tab(index, ask_before_close=False, project_settings=project_settings)
 
         self.reference_finder.clear()
 
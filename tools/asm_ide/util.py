@@ -77,7 +77,7 @@ def strip_comment(line: str):
     return line[:semi_colon_index].strip()
 
 
-DIRECTIVES = [
+DIRECTIVES = {
     ".LIST",
     ".NOLIST",
     ".MLIST",
@@ -117,9 +117,9 @@ DIRECTIVES = [
     ".INESCHR",
     ".INESMAP",
     ".INESMIR",
-]
+}
 
-INSTRUCTIONS = [
+INSTRUCTIONS = {
     "ADC",
     "AND",
     "ASL",
@@ -177,4 +177,4 @@ INSTRUCTIONS = [
     "TXA",
     "TXS",
     "TYA",
-]
+}